@@ -26,7 +26,7 @@ from ..llm.tool_context import (
     is_function_tool,
     is_raw_function_tool,
 )
-from .interruption_handler import InterruptionHandler, InterruptionHandlerConfig
+from .interruption_handler_mrinank import InterruptionHandler, InterruptionHandlerConfig
 from ..log import logger
 from ..metrics import (
     EOUMetrics,
@@ -12,21 +12,145 @@ playing audio.
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Literal
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+# Maps every non-word ASCII character to a space so tokenization is a pair of
+# C-level str ops (translate + split) instead of a regex scan. Hyphens are kept
+# so backchannels like "uh-huh" survive as a single token.
+_PUNCT_TO_SPACE = str.maketrans(
+    {c: " " for c in map(chr, range(128)) if not c.isalnum() and c != "-"}
+)
+
+# A-Z -> a-z lookup table; a plain LUT walk beats Unicode-aware str.lower()
+# on the ASCII transcripts STT produces.
+_ASCII_LOWER = {c: c + 32 for c in range(0x41, 0x5B)}
+
+
+def _lower(text: str) -> str:
+    return text.translate(_ASCII_LOWER) if text.isascii() else text.lower()
+
+
+def _noop(*args: object, **kwargs: object) -> None:
+    pass
+
+# Below this size a per-token set lookup beats the automaton scan, so the DFA
+# is only built for large domain-specific backchannel vocabularies.
+_AUTOMATON_MIN_WORDS = 16
+
+# Shared default so each config instance copies a tuple instead of rebuilding
+# the literal list.
+_DEFAULT_IGNORE = ("yeah", "ok", "okay", "hmm", "right", "uh-huh", "huh", "uh")
+
+
+@functools.lru_cache(maxsize=8)
+def _filler_automaton(ignore_words: frozenset[str]):  # type: ignore[no-untyped-def]
+    """Build a multi-pattern automaton over space-padded filler words.
+
+    Returns ``None`` when pyahocorasick is unavailable or the vocabulary is
+    small enough that the plain set lookup wins.
+    """
+    if ahocorasick is None or len(ignore_words) < _AUTOMATON_MIN_WORDS:
+        return None
+    # The token-scan fallback only ever sees clean single tokens, so an entry
+    # the tokenizer would split or rewrite (whitespace, mapped punctuation)
+    # could match here but never there. Keep both paths decision-identical by
+    # refusing to build the automaton for such vocabularies.
+    if any(word.translate(_PUNCT_TO_SPACE).split() != [word] for word in ignore_words):
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in ignore_words:
+        # Space sentinels give whole-word matches without tokenization.
+        automaton.add_word(f" {word} ", len(word) + 2)
+    automaton.make_automaton()
+    return automaton
+
+
+def _specialize_classifier(ignore_words: frozenset[str]) -> Callable[[str], tuple[bool, bool]]:
+    """Partially evaluate the classifier against a fixed ignore set.
+
+    The returned closure carries the ignore set and the cached scan in cells,
+    so the per-call path has no instance attribute loads left.
+    """
+
+    def classify(
+        transcript: str,
+        _classify: Callable[[str, frozenset[str]], tuple[bool, bool]] = _classify_cached,
+        _words: frozenset[str] = ignore_words,
+    ) -> tuple[bool, bool]:
+        return _classify(transcript, _words)
+
+    return classify
+
+
+def _classify_automaton(padded: str, automaton) -> tuple[bool, bool]:  # type: ignore[no-untyped-def]
+    """Single DFA pass over the padded transcript; any character left uncovered
+    by a filler match is non-filler residue."""
+    covered = bytearray(len(padded))
+    for end, length in automaton.iter(padded):
+        start = end - length + 1
+        covered[start : end + 1] = b"\x01" * length
+    had_word = False
+    for i, ch in enumerate(padded):
+        if ch != " ":
+            had_word = True
+            if not covered[i]:
+                return True, True
+    return had_word, False
+
+
+@functools.lru_cache(maxsize=512)
+def _classify_cached(
+    transcript: str,
+    ignore_words: frozenset[str],
+    # Hot globals bound as defaults so the scan uses LOAD_FAST; never passed
+    # by callers (and therefore never part of the cache key).
+    _lower: Callable[[str], str] = _lower,
+    _table: dict[int, str] = _PUNCT_TO_SPACE,
+) -> tuple[bool, bool]:
+    """Classify a transcript as (had_word, has_non_filler).
+
+    STT streams re-send the same short partials ("yeah", "ok") many times per
+    second, so repeated lookups resolve to a cache hit instead of re-running
+    the scan.
+    """
+    automaton = _filler_automaton(ignore_words)
+    if automaton is not None and transcript.isascii():
+        padded = f" {_lower(transcript).translate(_table)} "
+        # Edge hyphens need the strip semantics of the token scan below.
+        if " -" not in padded and "- " not in padded:
+            return _classify_automaton(padded, automaton)
+
+    had_word = False
+    for token in _lower(transcript).translate(_table).split():
+        token = token.strip("-")
+        if not token:
+            continue
+        had_word = True
+        if token not in ignore_words:
+            return True, True
+    return had_word, False
+
 
 @dataclass
 class InterruptionHandlerConfig:
     """Configuration for the interruption handler."""
     
     # Filler words that act as "soft inputs" - only ignored when agent is speaking
-    ignore_list: list[str] = field(
-        default_factory=lambda: ["yeah", "ok", "okay", "hmm", "right", "uh-huh", "huh", "uh"]
-    )
+    ignore_list: list[str] = field(default_factory=lambda: list(_DEFAULT_IGNORE))
     
     # Enable/disable the interruption handler
     enabled: bool = True
@@ -48,17 +172,54 @@ class InterruptionHandler:
     2. Active interruptions (user says "yeah" while agent is speaking)
     3. Semantic interruptions (user says "yeah wait a second" - contains command words)
     """
-    
+
+    # One handler per session/participant is common; slots drop the per-instance
+    # dict and make hot-path attribute access an offset load.
+    __slots__ = (
+        "_config",
+        "_ignore_list_lower",
+        "_fast_tokens",
+        "_classify_fast",
+        "_last_transcript",
+        "_last_result",
+        "_vlog",
+    )
+
     def __init__(self, config: InterruptionHandlerConfig | None = None):
         """Initialize the interruption handler."""
         self._config = config or InterruptionHandlerConfig()
+        # Callers typically decide and then immediately ask for the reason on
+        # the same transcript; remember the last classification so the second
+        # call is free.
+        self._last_transcript: str | None = None
+        self._last_result: tuple[bool, bool] = (False, False)
         self._normalize_ignore_list()
     
     def _normalize_ignore_list(self) -> None:
         """Normalize ignore list to lowercase for case-insensitive matching."""
-        self._ignore_list_lower = {word.lower().strip() for word in self._config.ignore_list}
-        if self._config.verbose_logging:
-            logger.info(f"Initialized ignore list: {self._ignore_list_lower}")
+        # frozenset doubles as the (hashable) cache key for _classify_cached
+        # and is rebuilt only when the ignore list changes.
+        self._ignore_list_lower = frozenset(
+            word.lower().strip() for word in self._config.ignore_list
+        )
+        # Only entries the tokenizer would emit verbatim may match a whole
+        # transcript on the fast path; entries it would split or rewrite
+        # (e.g. "got it") can never match in _classify and must not
+        # short-circuit here.
+        self._fast_tokens = frozenset(
+            word
+            for word in self._ignore_list_lower
+            if word == word.strip("-") and word.translate(_PUNCT_TO_SPACE).split() == [word]
+        )
+        self._classify_fast: Callable[[str], tuple[bool, bool]] = _specialize_classifier(
+            self._ignore_list_lower
+        )
+        self._last_transcript = None
+        # Bound here so verbose logging is a no-op call instead of a per-call
+        # branch plus config read; toggling verbose_logging takes effect on
+        # the next ignore-list update.
+        self._vlog = logger.info if self._config.verbose_logging else _noop
+        self._vlog("Initialized ignore list: %s", self._ignore_list_lower)
     
     def should_ignore_interrupt(
         self, 
@@ -79,52 +240,108 @@ class InterruptionHandler:
         """
         if not self._config.enabled or not transcript:
             return False
-        
-        # Extract words from transcript
-        words = self._extract_words(transcript)
-        
-        if self._config.verbose_logging:
-            logger.info(
-                f"Interrupt check: transcript='{transcript}', agent_speaking={agent_is_speaking}, "
-                f"words={words}, agent_state={current_agent_state}"
-            )
-        
+
+        # Fast path: streaming partials are overwhelmingly a single bare
+        # filler ("yeah", "ok"); one set lookup settles those without
+        # tokenizing.
+        if _lower(transcript.strip()) in self._fast_tokens:
+            return agent_is_speaking
+
+        had_word, has_non_filler = self._classify(transcript)
+
+        self._vlog(
+            "Interrupt check: transcript=%r, agent_speaking=%s, agent_state=%s",
+            transcript,
+            agent_is_speaking,
+            current_agent_state,
+        )
+
         # Rule 1: If the transcript contains non-filler words, it's always an interrupt
-        has_non_filler_words = self._has_non_filler_words(words)
-        
-        if has_non_filler_words:
-            if self._config.verbose_logging:
-                logger.info(f"Contains non-filler words: {words} -> INTERRUPT")
+        if has_non_filler:
+            self._vlog("Contains non-filler words: %r -> INTERRUPT", transcript)
             return False  # Always interrupt if non-filler words present
-        
+
         # Rule 2: If only filler words, only ignore if agent is actively speaking
-        if not words:  # Empty transcript after word extraction
+        if not had_word:  # Empty transcript after word extraction
             return False  # Empty text should not cause ignore
-        
+
         # All words are in ignore list
         if agent_is_speaking:
-            if self._config.verbose_logging:
-                logger.info(f"Agent is speaking and all words are filler -> IGNORE")
+            self._vlog("Agent is speaking and all words are filler -> IGNORE")
             return True  # Ignore backchannel while agent is speaking
         else:
-            if self._config.verbose_logging:
-                logger.info(f"Agent is NOT speaking but all words are filler -> RESPOND (passive ack)")
+            self._vlog("Agent is NOT speaking but all words are filler -> RESPOND (passive ack)")
             return False  # Don't ignore - agent should respond to passive affirmation
     
+    def _classify(self, transcript: str) -> tuple[bool, bool]:
+        """Single-pass scan returning (had_word, has_non_filler)."""
+        if transcript == self._last_transcript:
+            return self._last_result
+        result = self._classify_fast(transcript)
+        self._last_transcript = transcript
+        self._last_result = result
+        return result
+
+    def classify_batch(self, transcripts: list[str]) -> list[tuple[bool, bool]]:
+        """Classify many transcripts at once, e.g. for log replay or offline
+        evaluation.
+
+        Returns one (had_word, has_non_filler) tuple per transcript. The
+        per-call attribute lookups are hoisted out of the loop and repeated
+        transcripts resolve from the classifier cache, so the cost per entry
+        approaches a single dict hit on realistic corpora.
+        """
+        classify = _classify_cached
+        ignore_words = self._ignore_list_lower
+        return [classify(t, ignore_words) for t in transcripts]
+
+    def classify_many(self, transcripts: list[str]) -> np.ndarray:
+        """Vectorized bulk classification returning a bool array of
+        "has non-filler content" per transcript.
+
+        Tokens from all transcripts are flattened into one buffer so the
+        ignore-list membership test runs as a single np.isin over the batch
+        instead of a Python loop per token; per-transcript flags fall out of
+        cumulative-sum arithmetic on the row offsets.
+        """
+        tokens: list[str] = []
+        offsets = np.empty(len(transcripts) + 1, dtype=np.int64)
+        offsets[0] = 0
+        extract = self._extract_words
+        for i, text in enumerate(transcripts):
+            tokens.extend(extract(text))
+            offsets[i + 1] = len(tokens)
+        if not tokens:
+            return np.zeros(len(transcripts), dtype=bool)
+        non_filler = ~np.isin(
+            np.asarray(tokens, dtype=object),
+            np.asarray(list(self._ignore_list_lower), dtype=object),
+        )
+        counts = np.concatenate(([0], np.cumsum(non_filler)))
+        return (counts[offsets[1:]] - counts[offsets[:-1]]) > 0
+
     def _extract_words(self, text: str) -> list[str]:
-        """Extract and normalize words from text."""
-        # Simple word extraction - split by whitespace and punctuation
-        import re
-        # Split on whitespace and common punctuation
-        words = re.findall(r'\b\w+\b', text.lower())
-        return words
+        """Extract and normalize words from text.
+
+        Compatibility helper for external callers; the decision paths go
+        through :meth:`_classify` and never materialize the word list.
+        """
+        tokens = _lower(text).translate(_PUNCT_TO_SPACE).split()
+        return [t for t in (token.strip("-") for token in tokens) if t]
     
     def _has_non_filler_words(self, words: list[str]) -> bool:
-        """Check if the word list contains any non-filler words."""
-        for word in words:
-            if word not in self._ignore_list_lower:
-                return True
-        return False
+        """Check if the word list contains any non-filler words.
+
+        Compatibility helper; the decision paths use :meth:`_classify`.
+        """
+        # Short inputs keep the early-exit loop; longer ones are cheaper as a
+        # single C-level superset check.
+        if len(words) <= 2:
+            for word in words:
+                if word not in self._ignore_list_lower:
+                    return True
+            return False
+        return not self._ignore_list_lower.issuperset(words)
     
     def get_interrupt_reason(
         self,
@@ -132,12 +349,12 @@ class InterruptionHandler:
         agent_is_speaking: bool,
     ) -> str:
         """Get a human-readable reason for the interrupt decision."""
-        words = self._extract_words(transcript)
-        
-        if not words:
+        had_word, has_non_filler = self._classify(transcript)
+
+        if not had_word:
             return "empty_transcript"
-        
-        if self._has_non_filler_words(words):
+
+        if has_non_filler:
             return "contains_semantic_content"
         
         if agent_is_speaking:
@@ -149,22 +366,37 @@ class InterruptionHandler:
         """Update the ignore list at runtime."""
         self._config.ignore_list = new_ignore_list
         self._normalize_ignore_list()
-        logger.info(f"Updated ignore list to: {self._ignore_list_lower}")
+        # Drop cached decisions keyed on the old ignore list
+        _classify_cached.cache_clear()
+        logger.info("Updated ignore list to: %s", self._ignore_list_lower)
 
 
-# Global instance for easy access
+# Explicit override installed via set_default_handler, if any
+_override_handler: InterruptionHandler | None = None
+
 _default_handler: InterruptionHandler | None = None
+_default_handler_lock = threading.Lock()
 
 
 def get_default_handler() -> InterruptionHandler:
-    """Get or create the default interruption handler instance."""
+    """Get or create the default interruption handler instance.
+
+    Double-checked locking keeps the hit path a single global load while
+    guaranteeing exactly one construction when threads race on first use.
+    """
+    if _override_handler is not None:
+        return _override_handler
     global _default_handler
-    if _default_handler is None:
-        _default_handler = InterruptionHandler()
-    return _default_handler
+    handler = _default_handler
+    if handler is None:
+        with _default_handler_lock:
+            handler = _default_handler
+            if handler is None:
+                handler = _default_handler = InterruptionHandler()
+    return handler
 
 
 def set_default_handler(handler: InterruptionHandler) -> None:
     """Set the default interruption handler instance."""
-    global _default_handler
-    _default_handler = handler
+    global _override_handler
+    _override_handler = handler
@@ -5,60 +5,173 @@ This module tests the intelligent handling of backchannel utterances
 without requiring the full LiveKit dependencies.
 """
 
+import functools
+import pathlib
+import string
 import sys
-import re
-from datetime import datetime
+import time
 from typing import List, Tuple
 
+# Maps every non-word ASCII char to a space so tokenizing lowered text is a
+# pair of C-level str ops (translate + split) with no regex dispatch. Like
+# \w+, hyphens split tokens, so "uh-huh" still yields ["uh", "huh"].
+_WORD_CHARS = set(string.ascii_lowercase + string.digits + '_')
+_TRANS = str.maketrans({c: ' ' for c in map(chr, range(128)) if c not in _WORD_CHARS})
+
+# Shared default vocabulary; already lowercase and interned, so handlers built
+# without a custom list skip normalization entirely
+_DEFAULT_IGNORE = frozenset(
+    sys.intern(w) for w in ("yeah", "ok", "okay", "hmm", "right", "uh-huh", "huh", "uh")
+)
+
+def _build_filler_table(words):
+    """Try a (len, first, last)-based perfect hash over the default fillers.
+
+    Returns a 32-slot dispatch table, or None if the discriminator collides
+    (e.g. after the vocabulary is edited), in which case callers use the
+    generic set lookup.
+    """
+    table = [None] * 32
+    for word in words:
+        h = (len(word) * 31 + ord(word[0]) + ord(word[-1])) & 31
+        if table[h] is not None:
+            return None
+        table[h] = word
+    return table
+
+
+_FILLER_TABLE = _build_filler_table(_DEFAULT_IGNORE)
+
+# Repo-relative so the log lands next to the checkout on any machine
+_LOG_PATH = pathlib.Path(__file__).resolve().parent.parent / "test_output.log"
+
+# Static suite banner, assembled once at import
+_BANNER = (
+    "",
+    "╔" + "=" * 78 + "╗",
+    "║" + " " * 78 + "║",
+    "║" + "  LiveKit Interruption Handler - Test Suite".center(78) + "║",
+    "║" + "  Context-Aware Backchannel Handling".center(78) + "║",
+    "║" + " " * 78 + "║",
+    "╚" + "=" * 78 + "╝",
+)
+
 
 class InterruptionHandlerStandalone:
     """Standalone implementation for testing."""
-    
+
+    # No per-instance dict; the hot-path set fetch becomes an offset load
+    __slots__ = ("_ignore_list_lower",)
+
     def __init__(self, ignore_list=None):
+        # frozenset so it can key the lru-cached decision below; interned so
+        # membership tests against interned tokens hit the pointer-equality
+        # fast path instead of memcmp
         if ignore_list is None:
-            ignore_list = ["yeah", "ok", "okay", "hmm", "right", "uh-huh", "huh", "uh"]
-        self._ignore_list_lower = {word.lower().strip() for word in ignore_list}
-    
+            self._ignore_list_lower = _DEFAULT_IGNORE
+        else:
+            self._ignore_list_lower = frozenset(
+                sys.intern(word.lower().strip()) for word in ignore_list
+            )
+
     def should_ignore_interrupt(self, transcript, agent_is_speaking):
         """Determine if an interrupt should be ignored."""
-        if not transcript:
-            return False
-        
-        words = self._extract_words(transcript)
-        
-        if not words:
+        # Empty or punctuation-only input can't ignore anything; bail before
+        # paying for the lowercase copy and tokenizer
+        if not transcript or not any(map(str.isalnum, transcript)):
             return False
-        
-        has_non_filler_words = self._has_non_filler_words(words)
-        
-        if has_non_filler_words:
-            return False
-        
-        if agent_is_speaking:
-            return True
-        else:
+        return self._decide(transcript, agent_is_speaking, self._ignore_list_lower)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _decide(transcript, agent_is_speaking, ignore_words, _trans=_TRANS):
+        """Cached pure decision - the suite re-asks identical (transcript,
+        speaking) pairs across scenarios, which resolve to a dict hit here."""
+        intern = sys.intern
+        # The default vocabulary gets an array-index membership test via the
+        # perfect-hash table; custom lists use the generic set lookup.
+        table = _FILLER_TABLE if ignore_words is _DEFAULT_IGNORE else None
+        has_any_word = False
+        for word in transcript.lower().translate(_trans).split():
+            has_any_word = True
+            if table is not None:
+                h = (len(word) * 31 + ord(word[0]) + ord(word[-1])) & 31
+                if table[h] != word:
+                    return False
+            elif intern(word) not in ignore_words:
+                return False
+
+        if not has_any_word:
             return False
+
+        return agent_is_speaking
     
     def _extract_words(self, text):
         """Extract and normalize words from text."""
-        words = re.findall(r'\b\w+\b', text.lower())
-        return words
-    
-    def _has_non_filler_words(self, words):
-        """Check if word list contains non-filler words."""
-        for word in words:
-            if word not in self._ignore_list_lower:
-                return True
-        return False
-    
+        return text.lower().translate(_TRANS).split()
+
+    def should_ignore_interrupt_batch(self, transcripts, agent_speaking):
+        """Decide a whole corpus at once, e.g. for labeled regression sweeps.
+
+        agent_speaking is a parallel sequence of bools. Hoisting the method
+        and attribute lookups out of the loop and going straight through the
+        cached decision amortizes the per-call Python dispatch across the
+        batch.
+        """
+        decide = self._decide
+        ignore_words = self._ignore_list_lower
+        return [
+            bool(transcript) and decide(transcript, speaking, ignore_words)
+            for transcript, speaking in zip(transcripts, agent_speaking)
+        ]
+
+    def _scan(self, text, _trans=_TRANS):
+        """Fused single pass returning (has_any_word, has_non_filler).
+
+        Bails on the first non-filler token instead of materializing the
+        word list and walking it a second time.
+        """
+        intern = sys.intern
+        ignore_words = self._ignore_list_lower
+        has_any_word = False
+        for word in text.lower().translate(_trans).split():
+            has_any_word = True
+            if intern(word) not in ignore_words:
+                return True, True
+        return has_any_word, False
+
+    def evaluate(self, transcript, agent_is_speaking):
+        """Decide and explain in one pass, returning (should_ignore, reason).
+
+        Callers that want both the boolean and the reason string would
+        otherwise tokenize the transcript twice.
+        """
+        if not transcript or not any(map(str.isalnum, transcript)):
+            return False, "empty_transcript"
+
+        has_any_word, has_non_filler = self._scan(transcript)
+
+        if not has_any_word:
+            return False, "empty_transcript"
+
+        if has_non_filler:
+            return False, "contains_semantic_content"
+
+        if agent_is_speaking:
+            return True, "passive_acknowledgement_ignored_agent_speaking"
+        return False, "passive_acknowledgement_agent_silent"
+
     def get_interrupt_reason(self, transcript, agent_is_speaking):
         """Get reason for interrupt decision."""
-        words = self._extract_words(transcript)
-        
-        if not words:
+        if not transcript or not any(map(str.isalnum, transcript)):
             return "empty_transcript"
-        
-        if self._has_non_filler_words(words):
+
+        has_any_word, has_non_filler = self._scan(transcript)
+
+        if not has_any_word:
+            return "empty_transcript"
+
+        if has_non_filler:
             return "contains_semantic_content"
         
         if agent_is_speaking:
@@ -71,21 +184,58 @@ class TestLogger:
     """Custom logger for test output."""
     
     def __init__(self):
-        self.logs: List[str] = []
         self.test_results: List[Tuple[str, bool, str]] = []
-        
+        # Running tallies so the summary doesn't re-walk the results list
+        self._passed = 0
+        self._failed = 0
+        self._sec_cache = (-1, "")
+        # Lines stream to a buffered handle instead of accumulating in
+        # memory, so a large parametric sweep stays O(1). The file is opened
+        # on first emit so merely importing the module (e.g. pytest
+        # collection) never touches the filesystem.
+        self._logfile = None
+        self._logfile_opened = False
+
+    def _format(self, entry):
+        """Render one log entry. The HH:MM:SS prefix is recomputed only when
+        the second changes, replacing a strftime call per line with integer
+        arithmetic."""
+        ns, level, message = entry
+        sec, ns_rem = divmod(ns, 1_000_000_000)
+        cached_sec, prefix = self._sec_cache
+        if sec != cached_sec:
+            t = time.localtime(sec)
+            prefix = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+            self._sec_cache = (sec, prefix)
+        return f"[{prefix}.{ns_rem // 1_000_000:03d}] {level:12s} {message}"
+
     def log(self, level, message):
         """Log a message with timestamp."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        formatted_msg = f"[{timestamp}] {level:12s} {message}"
-        self.logs.append(formatted_msg)
-        print(formatted_msg)
+        line = self._format((time.time_ns(), level, message)) + "\n"
+        sys.stdout.write(line)
+        if not self._logfile_opened:
+            self._logfile_opened = True
+            # An unwritable location disables the file copy rather than
+            # aborting the run.
+            try:
+                self._logfile = _LOG_PATH.open("w", buffering=1 << 16)
+            except OSError:
+                self._logfile = None
+        if self._logfile is not None:
+            self._logfile.write(line)
+
+    def close(self):
+        """Flush and close the streamed log file."""
+        if self._logfile is not None:
+            self._logfile.close()
+            self._logfile = None
     
     def test_pass(self, test_name, details):
         """Record passing test."""
         self.log("PASS", f"✓ {test_name}")
         self.log("INFO", f"  └─ {details}")
         self.test_results.append((test_name, True, details))
+        self._passed += 1
     
     def test_fail(self, test_name, expected, actual):
         """Record failing test."""
@@ -93,6 +243,7 @@ class TestLogger:
         self.log("ERROR", f"  ├─ Expected: {expected}")
         self.log("ERROR", f"  └─ Actual: {actual}")
         self.test_results.append((test_name, False, f"Expected {expected}, got {actual}"))
+        self._failed += 1
     
     def section(self, title):
         """Log section header."""
@@ -103,14 +254,14 @@ class TestLogger:
     
     def print_summary(self):
         """Print test summary."""
-        passed = sum(1 for _, result, _ in self.test_results if result)
-        total = len(self.test_results)
+        passed = self._passed
+        total = passed + self._failed
         self.log("", "")
         self.log("", "=" * 80)
-        self.log("", f"TEST SUMMARY: {passed}/{total} passed ({100*passed//max(1,total)//1}%)")
+        self.log("", f"TEST SUMMARY: {passed}/{total} passed ({100 * passed // max(1, total)}%)")
         self.log("", "=" * 80)
-        
-        if passed < total:
+
+        if self._failed:
             self.log("", "Failed tests:")
             for name, result, details in self.test_results:
                 if not result:
@@ -141,12 +292,8 @@ def test_scenario_1_long_explanation():
     
     all_pass = True
     for transcript, _, description in test_cases:
-        should_ignore = handler.should_ignore_interrupt(
-            transcript=transcript,
-            agent_is_speaking=True
-        )
-        reason = handler.get_interrupt_reason(transcript, True)
-        
+        should_ignore, reason = handler.evaluate(transcript, agent_is_speaking=True)
+
         if should_ignore:
             test_log.test_pass(
                 f"Backchannel ignored: '{transcript}'",
@@ -183,12 +330,8 @@ def test_scenario_2_passive_affirmation():
     
     all_pass = True
     for transcript, _, description in test_cases:
-        should_ignore = handler.should_ignore_interrupt(
-            transcript=transcript,
-            agent_is_speaking=False
-        )
-        reason = handler.get_interrupt_reason(transcript, False)
-        
+        should_ignore, reason = handler.evaluate(transcript, agent_is_speaking=False)
+
         if not should_ignore:
             test_log.test_pass(
                 f"Passive affirmation responded: '{transcript}'",
@@ -225,12 +368,8 @@ def test_scenario_3_correction():
     
     all_pass = True
     for transcript, _, description in test_cases:
-        should_ignore = handler.should_ignore_interrupt(
-            transcript=transcript,
-            agent_is_speaking=True
-        )
-        reason = handler.get_interrupt_reason(transcript, True)
-        
+        should_ignore, reason = handler.evaluate(transcript, agent_is_speaking=True)
+
         if not should_ignore:
             test_log.test_pass(
                 f"Semantic content interrupts: '{transcript}'",
@@ -266,12 +405,8 @@ def test_scenario_4_mixed_input():
     
     all_pass = True
     for transcript, _, description in test_cases:
-        should_ignore = handler.should_ignore_interrupt(
-            transcript=transcript,
-            agent_is_speaking=True
-        )
-        reason = handler.get_interrupt_reason(transcript, True)
-        
+        should_ignore, reason = handler.evaluate(transcript, agent_is_speaking=True)
+
         if not should_ignore:
             test_log.test_pass(
                 f"Mixed content interrupts: '{transcript}'",
@@ -377,13 +512,8 @@ def test_scenario_6_state_transitions():
 
 def main():
     """Run all test scenarios."""
-    test_log.log("", "")
-    test_log.log("", "╔" + "=" * 78 + "╗")
-    test_log.log("", "║" + " " * 78 + "║")
-    test_log.log("", "║" + "  LiveKit Interruption Handler - Test Suite".center(78) + "║")
-    test_log.log("", "║" + "  Context-Aware Backchannel Handling".center(78) + "║")
-    test_log.log("", "║" + " " * 78 + "║")
-    test_log.log("", "╚" + "=" * 78 + "╝")
+    for line in _BANNER:
+        test_log.log("", line)
     
     results = []
     
@@ -401,13 +531,9 @@ def main():
         test_log.log("", f"  {scenario_name}: {status}")
     
     test_log.print_summary()
-    
-    # Save logs to file
-    with open("/Users/mrinankjitsingh/Desktop/GenAI submission/agents-assignment/test_output.log", "w") as f:
-        for log_line in test_log.logs:
-            f.write(log_line + "\n")
-    
+
     test_log.log("INFO", "Test logs saved to test_output.log")
+    test_log.close()
     
     all_passed = all(result for _, result in results)
     sys.exit(0 if all_passed else 1)